@@ -3,8 +3,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator, List
-import json
+from typing import Iterable, Iterator, List, Sized
+import itertools
+import sys
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to loading the whole fixture
+    ijson = None
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # optional: the stdlib parser also accepts bytes
+    from json import loads as _loads
 
 from .interfaces import (
     BetAdvice,
@@ -20,6 +31,9 @@ from .interfaces import (
     VisionAdapter,
 )
 
+_INTERNED_OBSERVATION_KEYS = ("rank", "zoneId")
+_COMMAND_META_KEYS = frozenset({"t", "command"})
+
 
 @dataclass
 class NoOpCaptureAdapter(CaptureAdapter):
@@ -28,18 +42,63 @@ class NoOpCaptureAdapter(CaptureAdapter):
     fixture_path: Path
 
     def stream(self) -> Iterator[PipelineEvent]:
-        with self.fixture_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        for item in payload.get("events", []):
+        """Yield fixture events, streaming them with ijson when it is installed.
+
+        Both branches raise ``ValueError`` for invalid JSON, a non-object top
+        level, or a non-array ``events``. Integers beyond 64 bits are only
+        rejected by ijson's C backend. To exercise the fallback where ijson is
+        installed, set ``adapters.ijson = None``.
+        """
+        if ijson is None:
+            with self.fixture_path.open("rb") as handle:
+                payload = _loads(handle.read())
+            if not isinstance(payload, dict):
+                raise self._layout_error()
+            items = payload.get("events", [])
+            if not isinstance(items, list):
+                raise self._layout_error()
+            yield from self._build_events(items)
+            return
+        with self.fixture_path.open("rb") as handle:
+            try:
+                parser = ijson.parse(handle, use_float=True)
+                first = next(parser, None)
+                if first is None or first[1] != "start_map":
+                    raise self._layout_error()
+                parser = self._require_events_array(itertools.chain((first,), parser))
+                yield from self._build_events(ijson.items(parser, "events.item"))
+            except ijson.JSONError as exc:
+                raise ValueError(f"Fixture '{self.fixture_path}' is not valid JSON: {exc}") from exc
+
+    def _require_events_array(self, parser: Iterator[tuple]) -> Iterator[tuple]:
+        for prefix, event, value in parser:
+            if prefix == "events" and event not in ("start_array", "end_array"):
+                raise self._layout_error()
+            yield prefix, event, value
+
+    def _layout_error(self) -> ValueError:
+        return ValueError(
+            f"Fixture '{self.fixture_path}' must be a JSON object with an 'events' array."
+        )
+
+    @staticmethod
+    def _build_events(items: Iterable[dict]) -> Iterator[PipelineEvent]:
+        for item in items:
             timestamp = float(item.get("t", 0.0))
             if "obs" in item:
-                yield ObservationEvent(timestamp=timestamp, observation=item["obs"])
+                observation = item["obs"]
+                # Ranks and zone ids come from small vocabularies used as dict keys.
+                for key in _INTERNED_OBSERVATION_KEYS:
+                    value = observation.get(key)
+                    if isinstance(value, str):
+                        observation[key] = sys.intern(value)
+                yield ObservationEvent(timestamp=timestamp, observation=observation)
             else:
                 command = item.get("command", "unknown")
                 payload = {
                     key: value
                     for key, value in item.items()
-                    if key not in {"t", "command"}
+                    if key not in _COMMAND_META_KEYS
                 }
                 yield CommandEvent(timestamp=timestamp, command=command, payload=payload)
 
@@ -49,7 +108,7 @@ class NoOpVisionAdapter(VisionAdapter):
     """Passes through observation events unchanged."""
 
     def process(self, events: Iterable[PipelineEvent]) -> Iterable[PipelineEvent]:
-        return list(events)
+        return events
 
 
 @dataclass
@@ -57,7 +116,7 @@ class NoOpGameStateTracker(GameStateTracker):
     """For now, just echoes events to downstream consumers."""
 
     def ingest(self, events: Iterable[PipelineEvent]) -> Iterable[PipelineEvent]:
-        return list(events)
+        return events
 
 
 @dataclass
@@ -67,20 +126,19 @@ class NoOpStrategyAdvisor(StrategyAdvisor):
     default_action: str = "Stand"
 
     def advise(self, state_events: Iterable[PipelineEvent]) -> List[StrategyAdvice]:
-        advice: List[StrategyAdvice] = []
-        for event in state_events:
-            if isinstance(event, ObservationEvent):
-                advice.append(
-                    StrategyAdvice(
-                        seatId=event.observation.get("zoneId", "seat"),
-                        handIndex=0,
-                        basicAction=self.default_action,
-                        deviationAction=None,
-                        deviationTag=None,
-                        trueCount=0.0,
-                    )
-                )
-        return advice
+        # Only the seat varies per observation; the rest is shared per call.
+        template = StrategyAdvice(
+            handIndex=0,
+            basicAction=self.default_action,
+            deviationAction=None,
+            deviationTag=None,
+            trueCount=0.0,
+        )
+        return [
+            {"seatId": event.observation.get("zoneId", "seat"), **template}
+            for event in state_events
+            if isinstance(event, ObservationEvent)
+        ]
 
 
 @dataclass
@@ -118,7 +176,10 @@ class InMemoryPersistenceAdapter(PersistenceAdapter):
         advice: List[StrategyAdvice],
         bets: List[BetAdvice],
     ) -> dict:
-        event_count = sum(1 for _ in events)
+        if isinstance(events, Sized):
+            event_count = len(events)
+        else:
+            event_count = sum(1 for _ in events)
         return {
             "events": event_count,
             "adviceCount": len(advice),
@@ -48,13 +48,13 @@ class RoundExport(TypedDict, total=False):
     penDepth: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationEvent:
     timestamp: float
     observation: CardObservation
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandEvent:
     timestamp: float
     command: str
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from .adapters import (
     InMemoryPersistenceAdapter,
@@ -28,16 +29,24 @@ class Pipeline:
         self.bets = NoOpBetSizingEngine()
         self.persistence = InMemoryPersistenceAdapter()
 
-    def run(self) -> dict:
+    def iter_events(self) -> Iterator[dict]:
+        """Yield captured events as plain dictionaries, one at a time."""
+        for event in self.capture.stream():
+            yield asdict(event)
+
+    def run(self, include_events: bool = False) -> dict:
         events = list(self.capture.stream())
-        vision_events = list(self.vision.process(events))
-        state_events = list(self.state_tracker.ingest(vision_events))
+        # Materialize once; pass-through stages hand the same list back.
+        state_events = self.state_tracker.ingest(self.vision.process(events))
+        if not isinstance(state_events, list):
+            state_events = list(state_events)
         strategy_advice = self.strategy.advise(state_events)
         bet_advice = self.bets.recommend(state_events)
         export = self.persistence.save_round(state_events, strategy_advice, bet_advice)
         return {
             "fixture": self.fixture_path.name,
-            "events": [event.__dict__ for event in events],
+            "events": [asdict(event) for event in events] if include_events else [],
+            "eventCount": len(events),
             "advice": strategy_advice,
             "bets": bet_advice,
             "export": export,
@@ -73,7 +82,7 @@ def main(argv: List[str] | None = None) -> int:
     pipeline = Pipeline(fixture_path)
     output = pipeline.run()
     print(f"Replay complete for fixture: {output['fixture']}")
-    print(f"Observed {len(output['events'])} events → {len(output['advice'])} advice entries, {len(output['bets'])} bet entries.")
+    print(f"Observed {output['eventCount']} events → {len(output['advice'])} advice entries, {len(output['bets'])} bet entries.")
     print("Export summary:")
     for key, value in output["export"].items():
         print(f"  {key}: {value}")
@@ -2,9 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable
-import json
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # optional: the stdlib parser also accepts bytes
+    from json import loads as _loads
 
 
 @dataclass
@@ -29,22 +34,42 @@ class SchemaRegistry:
 
 
 def load_all_schemas(contracts_dir: Path | None = None) -> SchemaRegistry:
-    """Load every JSON schema from the contracts directory."""
+    """Load every JSON schema from the contracts directory.
+
+    Registries are cached per resolved directory and shared between callers,
+    so treat the returned schemas as read-only.
+    """
+    if contracts_dir is None:
+        return _load_schemas(_default_contracts_dir())
+    return _load_schemas(Path(contracts_dir).resolve())
+
+
+@lru_cache(maxsize=1)
+def _default_contracts_dir() -> Path:
+    """Locate and resolve the bundled contracts directory once per process.
+
+    The result is cached, so the ``cwd/contracts`` fallback reflects the
+    working directory at the first call; later ``chdir`` calls are ignored.
+    """
+    module_path = Path(__file__).resolve()
+    search_roots = (
+        module_path.parents[1] / "contracts",
+        module_path.parents[2] / "contracts",
+        (Path.cwd() / "contracts").resolve(),
+    )
+    contracts_dir = next((candidate for candidate in search_roots if candidate.exists()), None)
     if contracts_dir is None:
-        module_path = Path(__file__).resolve()
-        search_roots = [
-            module_path.parents[1] / "contracts",
-            module_path.parents[2] / "contracts",
-            Path.cwd() / "contracts",
-        ]
-        for candidate in search_roots:
-            if candidate.exists():
-                contracts_dir = candidate
-                break
-        else:
-            raise FileNotFoundError("Could not locate contracts directory.")
+        raise FileNotFoundError("Could not locate contracts directory.")
+    return contracts_dir
+
+
+@lru_cache(maxsize=8)
+def _load_schemas(contracts_dir: Path) -> SchemaRegistry:
+    """Parse every schema under ``contracts_dir`` once per process."""
+    if not contracts_dir.is_dir():
+        raise FileNotFoundError(f"Contracts directory '{contracts_dir}' does not exist.")
     schemas: Dict[str, dict] = {}
     for path in sorted(contracts_dir.glob("*.json")):
-        with path.open("r", encoding="utf-8") as handle:
-            schemas[path.name] = json.load(handle)
+        with path.open("rb") as handle:
+            schemas[path.name] = _loads(handle.read())
     return SchemaRegistry(root=contracts_dir, schemas=schemas)